@@ -1,24 +1,74 @@
 #!/usr/bin/env python3
-"""CronCoin Dashboard API Backend - stdlib only HTTP server."""
+"""CronCoin Dashboard API Backend - stdlib only HTTP server (uses orjson/coincurve/gmpy2/pycryptodome if installed)."""
 
 import json
+import http.client
 import http.server
-import urllib.request
-import urllib.error
 import base64
 import os
 import sys
+import socket
+import select
 import re
 import hashlib
+import struct
+import gzip
+import zlib
 import hmac
 import math
 import sqlite3
 import uuid
 import secrets
 import datetime
+import decimal
+import functools
+import threading
+import itertools
+import collections
+import heapq
+import operator
+from concurrent.futures import ThreadPoolExecutor
 
 from bip39_english import WORDS as BIP39_WORDS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import coincurve  # libsecp256k1 bindings for pubkey derivation
+except ImportError:
+    coincurve = None
+
+try:
+    import gmpy2  # GMP field arithmetic for the pure-Python EC fallback
+except ImportError:
+    gmpy2 = None
+
+try:
+    from Crypto.Hash import RIPEMD160  # pycryptodome: C RIPEMD-160 where OpenSSL lacks it
+except ImportError:
+    RIPEMD160 = None
+
+
+# ---- JSON (orjson fast path, stdlib fallback; both produce/accept bytes) ----
+
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str)
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError  # subclass of json.JSONDecodeError
+else:
+    def _dumps(obj):
+        return json.dumps(obj, default=str).encode()
+
+    def _loads(data):
+        return json.loads(data)
+
+    _JSONDecodeError = json.JSONDecodeError
+
 
 # ---- secp256k1 / BIP32 / BIP39 / bech32 ----
 
@@ -26,58 +76,156 @@ _SECP256K1_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2
 _SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 _SECP256K1_Gx = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
 _SECP256K1_Gy = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+_SECP256K1_G = (_SECP256K1_Gx, _SECP256K1_Gy)
 _B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# Base58 works in radix 58^10 (largest power of 58 below 2^64) so the bigint is
+# divided/multiplied once per 10 digits; digits within a chunk use small ints.
+_B58_CHUNK = 10
+_B58_POW = [58 ** i for i in range(_B58_CHUNK + 1)]
+_B58_PAIRS = [a + b for a in _B58_ALPHABET for b in _B58_ALPHABET]  # 0..58^2-1 → 2 digits
+_B58_DECODE = bytes(_B58_ALPHABET.find(chr(i)) & 0xFF for i in range(256))  # 0xFF = invalid
+
+
+# Field modulus for the EC arithmetic: as an mpz every product and reduction runs in GMP
+_FIELD_P = gmpy2.mpz(_SECP256K1_P) if gmpy2 is not None else _SECP256K1_P
+
+
+def _field_inv(x):
+    """Inverse mod P by extended GCD (gmpy2.invert, else pow(x, -1, P)) instead of Fermat's x^(P-2)."""
+    if gmpy2 is not None:
+        return gmpy2.invert(x, _FIELD_P)
+    return pow(x, -1, _SECP256K1_P)
 
 
 def _ec_point_add(p1, p2):
     if p1 is None: return p2
     if p2 is None: return p1
-    P = _SECP256K1_P
+    P = _FIELD_P
     x1, y1 = p1; x2, y2 = p2
     if x1 == x2 and y1 != y2: return None
     if x1 == x2:
-        lam = (3 * x1 * x1) * pow(2 * y1, P - 2, P) % P
+        lam = (3 * x1 * x1) * _field_inv(2 * y1) % P
     else:
-        lam = (y2 - y1) * pow(x2 - x1, P - 2, P) % P
+        lam = (y2 - y1) * _field_inv(x2 - x1) % P
     x3 = (lam * lam - x1 - x2) % P
     y3 = (lam * (x1 - x3) - y1) % P
-    return (x3, y3)
-
-
-def _ec_point_mul(k, point):
-    result = None; addend = point
-    while k:
-        if k & 1: result = _ec_point_add(result, addend)
-        addend = _ec_point_add(addend, addend)
-        k >>= 1
-    return result
+    return (int(x3), int(y3))
+
+
+# Jacobian coordinates (X, Y, Z) ↔ affine (X/Z², Y/Z³): no field inversion per
+# add/double, one inversion when converting back. None is the point at infinity.
+
+def _jac_double(p):
+    if p is None: return None
+    P = _FIELD_P
+    X1, Y1, Z1 = p
+    if Y1 == 0: return None
+    A = X1 * X1 % P; B = Y1 * Y1 % P; C = B * B % P
+    D = 2 * ((X1 + B) * (X1 + B) - A - C) % P
+    E = 3 * A % P
+    X3 = (E * E - 2 * D) % P
+    Y3 = (E * (D - X3) - 8 * C) % P
+    Z3 = 2 * Y1 * Z1 % P
+    return (X3, Y3, Z3)
+
+
+def _jac_add_affine(p, q):
+    """Jacobian p + affine q (mixed addition)."""
+    if p is None: return (q[0], q[1], 1)
+    P = _FIELD_P
+    X1, Y1, Z1 = p; x2, y2 = q
+    Z1Z1 = Z1 * Z1 % P
+    H = (x2 * Z1Z1 - X1) % P
+    r = 2 * (y2 * Z1 * Z1Z1 - Y1) % P
+    if H == 0:
+        return _jac_double(p) if r == 0 else None
+    HH = H * H % P
+    I = 4 * HH % P
+    J = H * I % P
+    V = X1 * I % P
+    X3 = (r * r - J - 2 * V) % P
+    Y3 = (r * (V - X3) - 2 * Y1 * J) % P
+    Z3 = ((Z1 + H) * (Z1 + H) - Z1Z1 - HH) % P
+    return (X3, Y3, Z3)
+
+
+def _jac_to_affine(p):
+    if p is None: return None
+    P = _FIELD_P
+    X, Y, Z = p
+    zinv = _field_inv(Z)
+    zinv2 = zinv * zinv % P
+    return (int(X * zinv2 % P), int(Y * zinv2 * zinv % P))
+
+
+def _get_g_comb():
+    """Comb table over the generator, rows[i][j] = j·16^i·G (affine): one row per scalar
+    nibble, so k·G is at most 64 mixed additions and no doublings (built on first use, cached)."""
+    if hasattr(_get_g_comb, "_cache"):
+        return _get_g_comb._cache
+    rows, base = [], _SECP256K1_G
+    for _ in range(64):
+        row = [None, base]
+        for _j in range(2, 16):
+            row.append(_ec_point_add(row[-1], base))
+        rows.append(row)
+        base = _ec_point_add(row[15], base)  # 16·base
+    _get_g_comb._cache = rows
+    return rows
+
+
+def _ec_base_mul(k):
+    """k·G: one comb-table add per non-zero scalar nibble, low to high."""
+    k %= _SECP256K1_N
+    result = None
+    for row in _get_g_comb():
+        if not k:
+            break
+        nibble = k & 15
+        if nibble: result = _jac_add_affine(result, row[nibble])
+        k >>= 4
+    return _jac_to_affine(result)
 
 
 def _privkey_to_compressed_pubkey(key_bytes):
+    if coincurve is not None:
+        return coincurve.PublicKey.from_secret(key_bytes).format(compressed=True)
     k = int.from_bytes(key_bytes, "big")
-    x, y = _ec_point_mul(k, (_SECP256K1_Gx, _SECP256K1_Gy))
+    x, y = _ec_base_mul(k)
     prefix = b"\x02" if y % 2 == 0 else b"\x03"
     return prefix + x.to_bytes(32, "big")
 
 
 def _b58decode(s):
+    digits = s.encode("ascii").translate(_B58_DECODE)  # chars → digit values in C
+    if 0xFF in digits:
+        raise ValueError("Invalid base58 character")
     n = 0
-    for c in s:
-        n = n * 58 + _B58_ALPHABET.index(c)
+    for i in range(0, len(digits), _B58_CHUNK):
+        chunk = digits[i:i + _B58_CHUNK]
+        v = 0
+        for d in chunk:
+            v = v * 58 + d
+        n = n * _B58_POW[len(chunk)] + v
     byte_len = (n.bit_length() + 7) // 8
     result = n.to_bytes(byte_len, "big") if byte_len > 0 else b""
     # count only LEADING '1' characters (each = a 0x00 byte)
-    pad = 0
-    for c in s:
-        if c == "1": pad += 1
-        else: break
+    pad = len(s) - len(s.lstrip("1"))
     return bytes(pad) + result
 
 
+_sha256 = hashlib.sha256
+
+
+def _sha256d_checksum(payload):
+    """First 4 bytes of SHA256(SHA256(payload)); a checksum, so usedforsecurity=False."""
+    return _sha256(_sha256(payload, usedforsecurity=False).digest(), usedforsecurity=False).digest()[:4]
+
+
 def _b58decode_check(s):
     data = _b58decode(s)
     payload, cksum = data[:-4], data[-4:]
-    expected = hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    expected = _sha256d_checksum(payload)
     if cksum != expected:
         raise ValueError("Invalid base58 checksum")
     return payload
@@ -86,19 +234,21 @@ def _b58decode_check(s):
 def _b58encode(data):
     n = int.from_bytes(data, "big")
     result = []
+    base, pair_base, pairs = _B58_POW[_B58_CHUNK], _B58_POW[2], _B58_PAIRS
     while n > 0:
-        n, r = divmod(n, 58)
-        result.append(_B58_ALPHABET[r])
+        n, r = divmod(n, base)
+        for _ in range(_B58_CHUNK // 2):  # 10 digits, two at a time (least significant first)
+            r, d = divmod(r, pair_base)
+            result.append(pairs[d])
+    # the top chunk is zero-padded to 10 digits; strip that padding
+    encoded = "".join(reversed(result)).lstrip("1")
     # leading zero bytes → leading '1's
-    pad = 0
-    for b in data:
-        if b == 0: pad += 1
-        else: break
-    return ("1" * pad) + "".join(reversed(result))
+    pad = len(data) - len(data.lstrip(b"\x00"))
+    return ("1" * pad) + encoded
 
 
 def _b58encode_check(payload):
-    cksum = hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    cksum = _sha256d_checksum(payload)
     return _b58encode(payload + cksum)
 
 
@@ -111,29 +261,34 @@ def _parse_xprv(xprv_b58):
     return key, chain_code
 
 
-def _bip32_derive_child(key, chain_code, index):
+def _bip32_derive_child_int(key_int, chain_code, index, parent_pubkey=None):
+    """BIP32 private child step on an int key, so multi-step walks skip the bytes round-trip.
+
+    parent_pubkey: the parent's compressed pubkey, if the caller already has it.
+    """
+    key = key_int.to_bytes(32, "big")
     if index >= 0x80000000:  # hardened
         data = b"\x00" + key + index.to_bytes(4, "big")
     else:  # normal – needs compressed pubkey
-        data = _privkey_to_compressed_pubkey(key) + index.to_bytes(4, "big")
+        if parent_pubkey is None:
+            parent_pubkey = _privkey_to_compressed_pubkey(key)
+        data = parent_pubkey + index.to_bytes(4, "big")
     I = hmac.new(chain_code, data, hashlib.sha512).digest()
-    IL, IR = I[:32], I[32:]
-    child_key = (int.from_bytes(IL, "big") + int.from_bytes(key, "big")) % _SECP256K1_N
-    return child_key.to_bytes(32, "big"), IR
+    return (int.from_bytes(I[:32], "big") + key_int) % _SECP256K1_N, I[32:]
+
+
+def _bip32_derive_child(key, chain_code, index, parent_pubkey=None):
+    child_key, chain_code = _bip32_derive_child_int(int.from_bytes(key, "big"), chain_code, index, parent_pubkey)
+    return child_key.to_bytes(32, "big"), chain_code
 
 
 def _parse_hdkeypath(path_str):
     """Parse 'm/84h/1h/0h/0/39' → list of BIP32 child indices."""
     parts = path_str.strip().split("/")
     if parts[0] == "m":
-        parts = parts[1:]
-    indices = []
-    for p in parts:
-        if p.endswith("h") or p.endswith("'"):
-            indices.append(int(p[:-1]) + 0x80000000)
-        else:
-            indices.append(int(p))
-    return indices
+        del parts[0]
+    # int() rejects malformed components ("", "84x", "a"), as before
+    return [int(p[:-1]) + 0x80000000 if p[-1:] in ("h", "'") else int(p) for p in parts]
 
 
 def _privkey_to_wif(key_bytes, testnet=None):
@@ -214,12 +369,40 @@ def _privkey_to_address_info(privkey_input):
     }
 
 
+_account_cache = {}  # (xprv, hardened prefix indices) -> (key as int, chain_code)
+
+
 def derive_privkey_wif(xprv_b58, hdkeypath):
     """Derive WIF private key from master tprv and full HD key path."""
-    key, chain_code = _parse_xprv(xprv_b58)
-    for index in _parse_hdkeypath(hdkeypath):
-        key, chain_code = _bip32_derive_child(key, chain_code, index)
-    return _privkey_to_wif(key)
+    indices = _parse_hdkeypath(hdkeypath)
+    split = 0  # hardened steps are the costly ones: cache the walk up to the last of them
+    for i, index in enumerate(indices):
+        if index >= 0x80000000:
+            split = i + 1
+    prefix = (xprv_b58, tuple(indices[:split]))
+    node = _account_cache.get(prefix)
+    if node is None:
+        key, chain_code = _parse_xprv(xprv_b58)
+        key = int.from_bytes(key, "big")
+        for index in indices[:split]:
+            key, chain_code = _bip32_derive_child_int(key, chain_code, index)
+        node = _account_cache[prefix] = (key, chain_code)
+    key, chain_code = node
+    for index in indices[split:]:
+        key, chain_code = _bip32_derive_child_int(key, chain_code, index)
+    return _privkey_to_wif(key.to_bytes(32, "big"))
+
+
+def _extract_xprv(desc, prefixes):
+    """'wpkh(tprv…/…' → 'tprv…' when desc starts with one of prefixes (each ending in the 4-char key version), else None."""
+    for prefix in prefixes:
+        if desc.startswith(prefix):
+            start = len(prefix) - 4
+            end = desc.find("/", start)
+            key = desc[start:end]
+            if end > len(prefix) and key.isascii() and key.isalnum():
+                return key
+    return None
 
 
 def _get_master_tprv():
@@ -232,10 +415,10 @@ def _get_master_tprv():
     for d in result.get("descriptors", []):
         desc = d.get("desc", "")
         # Match wpkh(xprv.../0/*) or wpkh(tprv.../0/*) – receive address descriptor
-        m = re.match(r"^wpkh\(([xt]prv[A-Za-z0-9]+)/", desc)
-        if m and "/0/*)" in desc:
-            _get_master_tprv._cache = m.group(1)
-            return m.group(1)
+        key = _extract_xprv(desc, ("wpkh(xprv", "wpkh(tprv"))
+        if key and "/0/*)" in desc:
+            _get_master_tprv._cache = key
+            return key
     return None
 
 
@@ -252,16 +435,10 @@ def _entropy_to_mnemonic(entropy_bytes):
     # Checksum: first (entropy_bits / 32) bits of SHA256
     ent_bits = len(entropy_bytes) * 8
     cs_bits = ent_bits // 32
-    # Build bit string: entropy + checksum
-    bits = bin(int.from_bytes(entropy_bytes, "big"))[2:].zfill(ent_bits)
-    cs = bin(h[0])[2:].zfill(8)[:cs_bits]
-    all_bits = bits + cs
-    # Split into 11-bit groups → word indices
-    words = []
-    for i in range(0, len(all_bits), 11):
-        idx = int(all_bits[i:i + 11], 2)
-        words.append(BIP39_WORDS[idx])
-    return " ".join(words)
+    # entropy || checksum as one integer, then 11-bit groups → word indices (MSB first)
+    n = (int.from_bytes(entropy_bytes, "big") << cs_bits) | (h[0] >> (8 - cs_bits))
+    n_words = (ent_bits + cs_bits) // 11
+    return " ".join(BIP39_WORDS[(n >> (11 * i)) & 0x7FF] for i in range(n_words - 1, -1, -1))
 
 
 def _mnemonic_to_seed(mnemonic, passphrase=""):
@@ -311,88 +488,95 @@ def _encode_tpub(pubkey_bytes, chain_code, depth=0, fingerprint=b"\x00\x00\x00\x
 
 def _ripemd160(data):
     """Compute RIPEMD-160 hash."""
-    try:
-        h = hashlib.new("ripemd160")
-        h.update(data)
-        return h.digest()
-    except ValueError:
-        # OpenSSL 3.0+ may not support ripemd160; use fallback
-        return _ripemd160_fallback(data)
+    h = _RIPEMD160_TEMPLATE.copy()  # cheaper than hashlib.new's by-name lookup
+    h.update(data)
+    return h.digest()
+
+
+_RMD_RL = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,
+           7,4,13,1,10,6,15,3,12,0,9,5,2,14,11,8,
+           3,10,14,4,9,15,8,1,2,7,0,6,13,11,5,12,
+           1,9,11,10,0,8,12,4,13,3,7,15,14,5,6,2,
+           4,0,5,9,7,12,2,10,14,1,3,8,11,6,15,13]
+_RMD_RR = [5,14,7,0,9,2,11,4,13,6,15,8,1,10,3,12,
+           6,11,3,7,0,13,5,10,14,15,8,12,4,9,1,2,
+           15,5,1,3,7,14,6,9,11,8,12,2,10,0,4,13,
+           8,6,4,1,3,11,15,0,5,12,2,13,9,7,10,14,
+           12,15,10,4,1,5,8,7,6,2,13,14,0,3,9,11]
+_RMD_SL = [11,14,15,12,5,8,7,9,11,13,14,15,6,7,9,8,
+           7,6,8,13,11,9,7,15,7,12,15,9,11,7,13,12,
+           11,13,6,7,14,9,13,15,14,8,13,6,5,12,7,5,
+           11,12,14,15,14,15,9,8,9,14,5,6,8,6,5,12,
+           9,15,5,11,6,8,13,12,5,12,13,14,11,8,5,6]
+_RMD_SR = [8,9,9,11,13,15,15,5,7,7,8,11,14,14,12,6,
+           9,13,15,7,12,8,9,11,7,7,12,7,6,15,13,11,
+           9,7,15,11,8,6,6,14,12,13,5,14,13,13,7,5,
+           15,5,8,11,14,14,6,14,6,9,12,9,12,5,15,8,
+           8,5,12,9,12,5,14,6,8,13,6,5,15,13,11,11]
+_RMD_K_LEFT = [0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E]
+_RMD_K_RIGHT = [0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000]
+
+# Per round: ((word index, rotate, 32 - rotate), ...) for the left and right lines
+_RMD_STEPS_L = [tuple((_RMD_RL[j], _RMD_SL[j], 32 - _RMD_SL[j]) for j in range(r * 16, r * 16 + 16)) for r in range(5)]
+_RMD_STEPS_R = [tuple((_RMD_RR[j], _RMD_SR[j], 32 - _RMD_SR[j]) for j in range(r * 16, r * 16 + 16)) for r in range(5)]
+_RMD_WORDS = struct.Struct("<16I")
+
+
+def _rmd160_line(X, a, b, c, d, e, steps, K, fn_order):
+    """One RIPEMD-160 line (5 rounds × 16 steps); fn_order lists the boolean function per round."""
+    M = 0xFFFFFFFF
+    for rnd in range(5):
+        k = K[rnd]
+        fn = fn_order[rnd]
+        for xi, s, rs in steps[rnd]:
+            # f1..f5 written without ~ so every intermediate stays a non-negative 32-bit int
+            if fn == 0: f = b ^ c ^ d
+            elif fn == 1: f = d ^ (b & (c ^ d))
+            elif fn == 2: f = (b | (c ^ M)) ^ d
+            elif fn == 3: f = c ^ (d & (b ^ c))
+            else: f = b ^ (c | (d ^ M))
+            t = (a + f + X[xi] + k) & M
+            t = ((((t << s) | (t >> rs)) & M) + e) & M
+            a = e; e = d; d = ((c << 10) | (c >> 22)) & M; c = b; b = t
+    return a, b, c, d, e
 
 
 def _ripemd160_fallback(message):
     """Pure Python RIPEMD-160 implementation."""
-    # Constants
-    def f(j, x, y, z):
-        if j < 16: return x ^ y ^ z
-        if j < 32: return (x & y) | (~x & z)
-        if j < 48: return (x | ~y) ^ z
-        if j < 64: return (x & z) | (y & ~z)
-        return x ^ (y | ~z)
-
-    K_LEFT =  [0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E]
-    K_RIGHT = [0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000]
-
-    RL = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,
-          7,4,13,1,10,6,15,3,12,0,9,5,2,14,11,8,
-          3,10,14,4,9,15,8,1,2,7,0,6,13,11,5,12,
-          1,9,11,10,0,8,12,4,13,3,7,15,14,5,6,2,
-          4,0,5,9,7,12,2,10,14,1,3,8,11,6,15,13]
-    RR = [5,14,7,0,9,2,11,4,13,6,15,8,1,10,3,12,
-          6,11,3,7,0,13,5,10,14,15,8,12,4,9,1,2,
-          15,5,1,3,7,14,6,9,11,8,12,2,10,0,4,13,
-          8,6,4,1,3,11,15,0,5,12,2,13,9,7,10,14,
-          12,15,10,4,1,5,8,7,6,2,13,14,0,3,9,11]
-    SL = [11,14,15,12,5,8,7,9,11,13,14,15,6,7,9,8,
-          7,6,8,13,11,9,7,15,7,12,15,9,11,7,13,12,
-          11,13,6,7,14,9,13,15,14,8,13,6,5,12,7,5,
-          11,12,14,15,14,15,9,8,9,14,5,6,8,6,5,12,
-          9,15,5,11,6,8,13,12,5,12,13,14,11,8,5,6]
-    SR = [8,9,9,11,13,15,15,5,7,7,8,11,14,14,12,6,
-          9,13,15,7,12,8,9,11,7,7,12,7,6,15,13,11,
-          9,7,15,11,8,6,6,14,12,13,5,14,13,13,7,5,
-          15,5,8,11,14,14,6,14,6,9,12,9,12,5,15,8,
-          8,5,12,9,12,5,14,6,8,13,6,5,15,13,11,11]
-
-    MASK = 0xFFFFFFFF
-
-    def rol(x, n):
-        return ((x << n) | (x >> (32 - n))) & MASK
-
+    M = 0xFFFFFFFF
     # Padding
-    msg = bytearray(message)
-    l = len(msg) * 8
-    msg.append(0x80)
-    while len(msg) % 64 != 56:
-        msg.append(0)
-    msg += l.to_bytes(8, "little")
+    l = len(message) * 8
+    msg = bytes(message) + b"\x80" + bytes((55 - len(message)) % 64) + l.to_bytes(8, "little")
 
     h0, h1, h2, h3, h4 = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0
 
     for i in range(0, len(msg), 64):
-        X = [int.from_bytes(msg[i + j * 4:i + j * 4 + 4], "little") for j in range(16)]
-        al, bl, cl, dl, el = h0, h1, h2, h3, h4
-        ar, br, cr, dr, er = h0, h1, h2, h3, h4
-
-        for j in range(80):
-            rnd = j // 16
-            # Left
-            T = (al + f(j, bl, cl, dl) + X[RL[j]] + K_LEFT[rnd]) & MASK
-            T = (rol(T, SL[j]) + el) & MASK
-            al = el; el = dl; dl = rol(cl, 10); cl = bl; bl = T
-            # Right
-            T = (ar + f(79 - j, br, cr, dr) + X[RR[j]] + K_RIGHT[rnd]) & MASK
-            T = (rol(T, SR[j]) + er) & MASK
-            ar = er; er = dr; dr = rol(cr, 10); cr = br; br = T
-
-        T = (h1 + cl + dr) & MASK
-        h1 = (h2 + dl + er) & MASK
-        h2 = (h3 + el + ar) & MASK
-        h3 = (h4 + al + br) & MASK
-        h4 = (h0 + bl + cr) & MASK
+        X = _RMD_WORDS.unpack_from(msg, i)
+        al, bl, cl, dl, el = _rmd160_line(X, h0, h1, h2, h3, h4, _RMD_STEPS_L, _RMD_K_LEFT, (0, 1, 2, 3, 4))
+        ar, br, cr, dr, er = _rmd160_line(X, h0, h1, h2, h3, h4, _RMD_STEPS_R, _RMD_K_RIGHT, (4, 3, 2, 1, 0))
+
+        T = (h1 + cl + dr) & M
+        h1 = (h2 + dl + er) & M
+        h2 = (h3 + el + ar) & M
+        h3 = (h4 + al + br) & M
+        h4 = (h0 + bl + cr) & M
         h0 = T
 
-    return b"".join(v.to_bytes(4, "little") for v in [h0, h1, h2, h3, h4])
+    return struct.pack("<5I", h0, h1, h2, h3, h4)
+
+
+# OpenSSL 3.0+ may not support ripemd160: decide once, not per call, which
+# implementation backs _ripemd160 (pycryptodome's C version, else pure Python)
+try:
+    _RIPEMD160_TEMPLATE = hashlib.new("ripemd160")
+except ValueError:
+    _RIPEMD160_TEMPLATE = None
+    if RIPEMD160 is not None:
+        def _ripemd160(data):
+            """Compute RIPEMD-160 hash (pycryptodome)."""
+            return RIPEMD160.new(data).digest()
+    else:
+        _ripemd160 = _ripemd160_fallback
 
 
 def _hash160(data):
@@ -405,14 +589,19 @@ def _hash160(data):
 _BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
 
-def _bech32_polymod(values):
-    GEN = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
+_BECH32_GEN = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+# XOR of the generators selected by each 5-bit value shifted out of the state
+_BECH32_GEN_TABLE = [
+    functools.reduce(operator.xor, (g for i, g in enumerate(_BECH32_GEN) if b >> i & 1), 0)
+    for b in range(32)
+]
+
+
+def _bech32_polymod(values, chk=1):
+    """BCH checksum state over values, continuing from chk (1 = fresh)."""
+    table = _BECH32_GEN_TABLE
     for v in values:
-        b = chk >> 25
-        chk = ((chk & 0x1ffffff) << 5) ^ v
-        for i in range(5):
-            chk ^= GEN[i] if ((b >> i) & 1) else 0
+        chk = ((chk & 0x1ffffff) << 5) ^ v ^ table[chk >> 25]
     return chk
 
 
@@ -420,9 +609,14 @@ def _bech32_hrp_expand(hrp):
     return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
 
 
+_bech32_hrp_state = {}  # hrp -> polymod state after its expansion (same for every address)
+
+
 def _bech32_create_checksum(hrp, data):
-    values = _bech32_hrp_expand(hrp) + data
-    polymod = _bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    chk = _bech32_hrp_state.get(hrp)
+    if chk is None:
+        chk = _bech32_hrp_state[hrp] = _bech32_polymod(_bech32_hrp_expand(hrp))
+    polymod = _bech32_polymod(data + [0, 0, 0, 0, 0, 0], chk) ^ 1
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
@@ -451,13 +645,26 @@ def _convertbits(data, frombits, tobits, pad=True):
     return ret
 
 
+def _convertbits_20_8_5(data):
+    """_convertbits(data, 8, 5) for a 20-byte witness program: 160 bits are exactly 32 groups, no padding.
+
+    Unrolled over four 40-bit words (8 groups each), which stay machine-word sized.
+    """
+    a = int.from_bytes(data[0:5], "big"); b = int.from_bytes(data[5:10], "big")
+    c = int.from_bytes(data[10:15], "big"); d = int.from_bytes(data[15:20], "big")
+    return [a >> 35, a >> 30 & 31, a >> 25 & 31, a >> 20 & 31, a >> 15 & 31, a >> 10 & 31, a >> 5 & 31, a & 31,
+            b >> 35, b >> 30 & 31, b >> 25 & 31, b >> 20 & 31, b >> 15 & 31, b >> 10 & 31, b >> 5 & 31, b & 31,
+            c >> 35, c >> 30 & 31, c >> 25 & 31, c >> 20 & 31, c >> 15 & 31, c >> 10 & 31, c >> 5 & 31, c & 31,
+            d >> 35, d >> 30 & 31, d >> 25 & 31, d >> 20 & 31, d >> 15 & 31, d >> 10 & 31, d >> 5 & 31, d & 31]
+
+
 def _pubkey_to_bech32_address(pubkey_bytes, hrp=None):
     """Convert compressed pubkey to bech32 P2WPKH address."""
     if hrp is None:
         hrp = _get_bech32_hrp()
     witness_program = _hash160(pubkey_bytes)
     # witness version 0 + convertbits(20 bytes, 8→5)
-    data5 = _convertbits(witness_program, 8, 5)
+    data5 = _convertbits_20_8_5(witness_program)
     return _bech32_encode(hrp, [0] + data5)
 
 
@@ -510,8 +717,13 @@ def _bip32_derive_child_pub(parent_pub_bytes, chain_code, index):
     il_int = int.from_bytes(IL, "big")
     if il_int >= _SECP256K1_N:
         raise ValueError("Invalid child key")
+    if coincurve is not None:
+        try:  # tweak-add: parent + IL·G
+            return coincurve.PublicKey(parent_pub_bytes).add(IL).format(compressed=True), IR
+        except ValueError:
+            raise ValueError("Invalid child key (point at infinity)")
     parent_point = _decompress_pubkey(parent_pub_bytes)
-    il_point = _ec_point_mul(il_int, (_SECP256K1_Gx, _SECP256K1_Gy))
+    il_point = _ec_base_mul(il_int)
     child_point = _ec_point_add(parent_point, il_point)
     if child_point is None:
         raise ValueError("Invalid child key (point at infinity)")
@@ -552,12 +764,11 @@ def _recover_from_mnemonic(mnemonic, passphrase="", derivation_path="m/84h/1h/0h
     path_parts = derivation_path.strip().split("/")
 
     derivation_chain = [{"path": "m", "xprv": master_tprv, "xpub": master_tpub}]
-    key, chain = master_key, master_chain
+    key, chain, pub = master_key, master_chain, master_pub
     fingerprint = b"\x00\x00\x00\x00"
     for i, idx in enumerate(indices):
-        parent_pub = _privkey_to_compressed_pubkey(key)
-        fingerprint = _hash160(parent_pub)[:4]
-        key, chain = _bip32_derive_child(key, chain, idx)
+        # One scalar mult per level: the child's pubkey is the next parent's
+        key, chain, fingerprint = _derive_child_with_fingerprint(key, chain, idx, pub)
         depth = i + 1
         pub = _privkey_to_compressed_pubkey(key)
         level_path = "/".join(path_parts[:depth + 1])
@@ -568,7 +779,7 @@ def _recover_from_mnemonic(mnemonic, passphrase="", derivation_path="m/84h/1h/0h
         })
 
     privkey_wif = _privkey_to_wif(key)
-    pubkey = _privkey_to_compressed_pubkey(key)
+    pubkey = pub
     address = _pubkey_to_bech32_address(pubkey)
 
     return {
@@ -613,11 +824,12 @@ def _recover_from_xpub(xpub_b58, child_path="0/0"):
     }
 
 
-def _derive_child_with_fingerprint(parent_key, parent_chain_code, index):
+def _derive_child_with_fingerprint(parent_key, parent_chain_code, index, parent_pub=None):
     """Derive child key and compute parent fingerprint."""
-    parent_pub = _privkey_to_compressed_pubkey(parent_key)
+    if parent_pub is None:
+        parent_pub = _privkey_to_compressed_pubkey(parent_key)
     fingerprint = _hash160(parent_pub)[:4]
-    child_key, child_chain = _bip32_derive_child(parent_key, parent_chain_code, index)
+    child_key, child_chain = _bip32_derive_child(parent_key, parent_chain_code, index, parent_pub)
     return child_key, child_chain, fingerprint
 
 
@@ -650,12 +862,11 @@ def _full_hd_generate(entropy_bits=128, passphrase="", derivation_path="m/84h/1h
         "xpub": master_tpub,
     })
 
-    key, chain = master_key, master_chain
+    key, chain, pub = master_key, master_chain, master_pub
     fingerprint = b"\x00\x00\x00\x00"
     for i, idx in enumerate(indices):
-        parent_pub = _privkey_to_compressed_pubkey(key)
-        fingerprint = _hash160(parent_pub)[:4]
-        key, chain = _bip32_derive_child(key, chain, idx)
+        # One scalar mult per level: the child's pubkey is the next parent's
+        key, chain, fingerprint = _derive_child_with_fingerprint(key, chain, idx, pub)
         depth = i + 1
         pub = _privkey_to_compressed_pubkey(key)
         level_path = "/".join(path_parts[:depth + 1])
@@ -668,8 +879,8 @@ def _full_hd_generate(entropy_bits=128, passphrase="", derivation_path="m/84h/1h
     # Step 6: Private key (WIF)
     privkey_wif = _privkey_to_wif(key)
 
-    # Step 7: Public key (compressed)
-    pubkey = _privkey_to_compressed_pubkey(key)
+    # Step 7: Public key (compressed) – already computed for the last level
+    pubkey = pub
 
     # Step 8: Address (bech32 P2WPKH)
     address = _pubkey_to_bech32_address(pubkey)
@@ -700,6 +911,7 @@ COOKIE_FILE = os.environ.get(
     os.path.expanduser("~/.croncoin/.cookie" if IS_MAINNET else "~/.croncoin/testnet3/.cookie"),
 )
 LISTEN_PORT = int(os.environ.get("DASHBOARD_PORT", "5000"))
+WORKERS = int(os.environ.get("DASHBOARD_WORKERS", "1"))  # >1: forked processes sharing the port (SO_REUSEPORT)
 WALLET_NAME = os.environ.get("WALLET_NAME", "default")
 STATIC_DIR = os.environ.get("STATIC_DIR", os.path.expanduser("~/html"))
 
@@ -719,7 +931,11 @@ MIME_TYPES = {
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "croncoin.db")
 UPLOAD_DIR = os.path.expanduser("~/www/html/uploads")
 
-_rpc_id = 0
+_rpc_ids = itertools.count(1)  # next() is atomic under the GIL
+
+RPC_TIMEOUT = 30
+RPC_POOL_SIZE = 8   # idle keep-alive connections kept for reuse
+_rpc_pool = []      # list.pop()/append() are atomic, so threads can share it
 
 
 def _get_auth():
@@ -733,49 +949,183 @@ def _get_auth():
         return "__cookie__:password"
 
 
-def rpc_call(method, params=None):
-    """Make a JSON-RPC call to croncoind."""
-    global _rpc_id
-    _rpc_id += 1
+_auth_cache = {"entry": (None, None)}  # (cookie mtime_ns, RPC request headers)
+
+
+def _get_rpc_headers():
+    """Get the (shared, read-only) RPC request headers, re-reading the cookie only when its mtime changes."""
+    if RPC_USER and RPC_PASSWORD:
+        mtime = 0
+    else:
+        try:
+            mtime = os.stat(COOKIE_FILE).st_mtime_ns
+        except OSError:
+            mtime = -1
+    cached_mtime, headers = _auth_cache["entry"]
+    if headers is None or mtime != cached_mtime:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": "Basic " + base64.b64encode(_get_auth().encode()).decode(),
+        }
+        _auth_cache["entry"] = (mtime, headers)
+    return headers
+
+
+# Calls with side effects: never resent, since the daemon may have run the first copy
+_RPC_NO_RETRY = frozenset({
+    "walletpassphrase", "walletpassphrasechange", "walletlock", "encryptwallet",
+    "getnewaddress", "getrawchangeaddress", "createwallet", "loadwallet", "unloadwallet",
+    "importprivkey", "importdescriptors", "importmulti", "backupwallet", "keypoolrefill",
+    "lockunspent", "abandontransaction", "bumpfee", "submitblock", "generatetoaddress",
+})
+
+
+def _rpc_retryable(method):
+    return not method.startswith("send") and method not in _RPC_NO_RETRY
+
+
+def _rpc_pooled_conn():
+    """Pop a pooled keep-alive connection the daemon hasn't closed yet, or None."""
+    while True:
+        try:
+            conn = _rpc_pool.pop()
+        except IndexError:
+            return None
+        try:  # an idle socket has nothing to read; readable means EOF/reset
+            if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+                return conn
+        except (OSError, ValueError):
+            pass
+        conn.close()
+
+
+def _rpc_post(payload, decode=True, retry=True):
+    """POST a JSON-RPC payload to croncoind → (decoded body, None) or (None, error).
+
+    With decode=False a successful (HTTP 200) body is returned as raw bytes.
+
+    Reuses pooled keep-alive connections, skipping any the daemon has
+    already closed. If a reused socket is still dropped before any reply
+    byte arrives, the request is sent once more on a fresh connection.
+    With retry=False (calls with side effects) the request always goes
+    out on a fresh connection and is never resent.
+    """
+    wallet_path = f"/wallet/{WALLET_NAME}" if WALLET_NAME else "/"
+    headers = _get_rpc_headers()
+
+    while True:
+        conn = _rpc_pooled_conn() if retry else None
+        reused = conn is not None
+        if not reused:
+            conn = http.client.HTTPConnection(RPC_HOST, RPC_PORT, timeout=RPC_TIMEOUT)
+        try:
+            conn.request("POST", wallet_path, body=payload, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except http.client.RemoteDisconnected as e:
+            conn.close()
+            if reused:
+                continue  # idle keep-alive socket the daemon dropped: retry on a new connection
+            return None, {"message": str(e), "code": -1}
+        except Exception as e:
+            conn.close()
+            return None, {"message": str(e), "code": -1}
+        break
+
+    if resp.will_close or len(_rpc_pool) >= RPC_POOL_SIZE:
+        conn.close()
+    else:
+        _rpc_pool.append(conn)
+
+    try:
+        if resp.status != 200:
+            text = body.decode()
+            try:
+                err = _loads(text)
+                return None, err.get("error", {"message": text, "code": resp.status})
+            except _JSONDecodeError:
+                return None, {"message": text, "code": resp.status}
+        return (_loads(body) if decode else body), None
+    except Exception as e:
+        return None, {"message": str(e), "code": -1}
 
-    auth = _get_auth()
-    wallet_path = f"/wallet/{WALLET_NAME}" if WALLET_NAME else ""
-    url = f"http://{RPC_HOST}:{RPC_PORT}{wallet_path}"
 
-    payload = json.dumps({
+def rpc_call(method, params=None):
+    """Make a JSON-RPC call to croncoind."""
+    data, err = _rpc_post(_dumps({
         "jsonrpc": "1.0",
-        "id": _rpc_id,
+        "id": next(_rpc_ids),
         "method": method,
         "params": params or [],
-    }).encode()
+    }), retry=_rpc_retryable(method))
+    if err:
+        return None, err
+    if data.get("error"):
+        return None, data["error"]
+    return data.get("result"), None
 
-    auth_b64 = base64.b64encode(auth.encode()).decode()
-    req = urllib.request.Request(
-        url,
-        data=payload,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Basic {auth_b64}",
-        },
-    )
 
+def rpc_call_raw(method, params=None):
+    """Like rpc_call, but return the result as croncoind's own JSON bytes.
+
+    The daemon replies {"result":<R>,"error":null,"id":<id>}; when the reply
+    has exactly that layout R is sliced out without being decoded.
+    Anything else is decoded and re-encoded.
+    """
+    rpc_id = next(_rpc_ids)
+    body, err = _rpc_post(_dumps({
+        "jsonrpc": "1.0",
+        "id": rpc_id,
+        "method": method,
+        "params": params or [],
+    }), decode=False, retry=_rpc_retryable(method))
+    if err:
+        return None, err
+    prefix, suffix = b'{"result":', b',"error":null,"id":%d}' % rpc_id
+    body = body.rstrip()
+    if body.startswith(prefix) and body.endswith(suffix):
+        return body[len(prefix):-len(suffix)], None
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
-            if data.get("error"):
-                return None, data["error"]
-            return data.get("result"), None
-    except urllib.error.HTTPError as e:
-        body = e.read().decode()
-        try:
-            err = json.loads(body)
-            return None, err.get("error", {"message": body, "code": e.code})
-        except json.JSONDecodeError:
-            return None, {"message": body, "code": e.code}
-    except urllib.error.URLError as e:
-        return None, {"message": str(e.reason), "code": -1}
+        data = _loads(body)
     except Exception as e:
         return None, {"message": str(e), "code": -1}
+    if data.get("error"):
+        return None, data["error"]
+    return _dumps(data.get("result")), None
+
+
+# Errors meaning the node refuses the array form itself: invalid request / parse error
+_RPC_BATCH_REJECTED = (-32600, -32700)
+
+
+def rpc_batch(calls):
+    """Send [(method, params), ...] as one JSON-RPC batch → [(result, error), ...] in call order.
+
+    A node that rejects batches (HTTP 200 with a non-array reply, or an
+    invalid-request/parse error) gets the calls one at a time, from then on.
+    Any other failure (timeout, busy work queue, reset) is reported as every
+    call's error and batching stays on.
+    """
+    if not calls:
+        return []
+    if not getattr(rpc_batch, "_unsupported", False):
+        data, err = _rpc_post(_dumps([
+            {"jsonrpc": "1.0", "id": i, "method": method, "params": params or []}
+            for i, (method, params) in enumerate(calls)
+        ]), retry=all(_rpc_retryable(method) for method, _ in calls))
+        if err is None and isinstance(data, list):
+            results = [(None, {"message": "Missing batch response", "code": -1})] * len(calls)
+            for r in data:
+                if not isinstance(r, dict):
+                    continue
+                i = r.get("id")
+                if isinstance(i, int) and 0 <= i < len(calls):
+                    results[i] = (None, r["error"]) if r.get("error") else (r.get("result"), None)
+            return results
+        if err is not None and not (isinstance(err, dict) and err.get("code") in _RPC_BATCH_REJECTED):
+            return [(None, err)] * len(calls)
+        rpc_batch._unsupported = True  # one-at-a-time from now on
+    return [rpc_call(method, params) for method, params in calls]
 
 
 def _get_db():
@@ -873,9 +1223,24 @@ def _get_current_user(handler):
 
 def json_response(handler, data, status=200, cookies=None):
     """Send a JSON HTTP response with optional Set-Cookie headers."""
-    body = json.dumps(data, default=str).encode()
+    json_response_raw(handler, _dumps(data), status, cookies)
+
+
+GZIP_MIN_BYTES = 4096  # smaller bodies aren't worth compressing
+
+
+def json_response_raw(handler, body, status=200, cookies=None):
+    """Send already-encoded JSON bytes (e.g. from rpc_call_raw) as an HTTP response."""
+    compressible = len(body) > GZIP_MIN_BYTES
+    gzipped = compressible and "gzip" in handler.headers.get("Accept-Encoding", "")
+    if gzipped:
+        body = gzip.compress(body, compresslevel=1)
     handler.send_response(status)
     handler.send_header("Content-Type", "application/json")
+    if gzipped:
+        handler.send_header("Content-Encoding", "gzip")
+    if compressible:  # caches must key on Accept-Encoding for both variants
+        handler.send_header("Vary", "Accept-Encoding")
     handler.send_header("Content-Length", str(len(body)))
     handler.send_header("Access-Control-Allow-Origin", "*")
     handler.send_header("Access-Control-Allow-Credentials", "true")
@@ -886,39 +1251,99 @@ def json_response(handler, data, status=200, cookies=None):
     handler.wfile.write(body)
 
 
+STREAM_MIN_ITEMS = 256       # shorter lists are sent in one piece with Content-Length
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def json_stream_response(handler, data, key, status=200):
+    """Send data (a dict) as JSON, streaming the list data[key] item by item.
+
+    Large lists are serialized incrementally instead of into one body; the
+    response has no Content-Length and ends when the connection closes.
+    Clients that accept gzip get the stream through one gzip compressor.
+    """
+    items = data[key]
+    if len(items) < STREAM_MIN_ITEMS:
+        return json_response(handler, data, status)
+    gzipped = "gzip" in handler.headers.get("Accept-Encoding", "")
+    # Serialize the envelope with an empty list placed last, then split at its "[]"
+    head = _dumps({**{k: v for k, v in data.items() if k != key}, key: []})
+    handler.send_response(status)
+    handler.send_header("Content-Type", "application/json")
+    if gzipped:
+        handler.send_header("Content-Encoding", "gzip")
+    handler.send_header("Vary", "Accept-Encoding")
+    handler.send_header("Access-Control-Allow-Origin", "*")
+    handler.send_header("Access-Control-Allow-Credentials", "true")
+    handler.send_header("Connection", "close")
+    handler.end_headers()
+    handler.close_connection = True
+    z = zlib.compressobj(1, zlib.DEFLATED, 31) if gzipped else None  # wbits=31: gzip framing
+    write = handler.wfile.write
+    buf = bytearray(head[:-2])  # ... "key":[
+    for i, item in enumerate(items):
+        if i:
+            buf += b","
+        buf += _dumps(item)
+        if len(buf) >= STREAM_CHUNK_BYTES:
+            out = z.compress(buf) if z else buf
+            if out:
+                write(out)
+            buf.clear()
+    buf += b"]}"
+    write(z.compress(buf) + z.flush() if z else buf)
+
+
 def error_response(handler, message, status=500):
     json_response(handler, {"error": message}, status)
 
 
-# Route patterns: (method, regex) -> handler
-ROUTES = []
+# Route tables: literal paths are a dict probe, parameterized ones a regex scan
+STATIC_ROUTES = {}   # (method, path) -> handler
+DYNAMIC_ROUTES = {}  # method -> [(regex, handler), ...]
+
+_REGEX_META = set("[](){}\\+*?|^$.")
 
 
 def route(method, pattern):
     """Decorator to register a route."""
     def decorator(func):
-        ROUTES.append((method, re.compile(f"^{pattern}$"), func))
+        if _REGEX_META.isdisjoint(pattern):
+            STATIC_ROUTES[(method, pattern)] = func
+        else:
+            # Request paths are ASCII; re.ASCII keeps \d etc. off the Unicode tables
+            DYNAMIC_ROUTES.setdefault(method, []).append((re.compile(pattern, re.ASCII), func))
         return func
     return decorator
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve(method, path):
+    """Resolve a parameterized route → (handler, match) or None (cached per path)."""
+    for pattern, func in DYNAMIC_ROUTES.get(method, ()):
+        m = pattern.fullmatch(path)
+        if m:
+            return func, m
+    return None
+
+
 # --- GET endpoints ---
 
 @route("GET", r"/api/blockchain")
 def get_blockchain(handler, match):
-    result, err = rpc_call("getblockchaininfo")
+    result, err = rpc_call_raw("getblockchaininfo")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/block/([0-9a-fA-F]{64})")
 def get_block(handler, match):
     blockhash = match.group(1)
-    result, err = rpc_call("getblock", [blockhash, 2])
+    result, err = rpc_call_raw("getblock", [blockhash, 2])
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/blockheight/(\d+)")
@@ -927,59 +1352,59 @@ def get_block_by_height(handler, match):
     blockhash, err = rpc_call("getblockhash", [height])
     if err:
         return error_response(handler, err["message"])
-    result, err = rpc_call("getblock", [blockhash, 2])
+    result, err = rpc_call_raw("getblock", [blockhash, 2])
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/tx/([0-9a-fA-F]{64})")
 def get_tx(handler, match):
     txid = match.group(1)
-    result, err = rpc_call("getrawtransaction", [txid, True])
+    result, err = rpc_call_raw("getrawtransaction", [txid, True])
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/mempool")
 def get_mempool(handler, match):
-    result, err = rpc_call("getmempoolinfo")
+    result, err = rpc_call_raw("getmempoolinfo")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/network")
 def get_network(handler, match):
-    result, err = rpc_call("getnetworkinfo")
+    result, err = rpc_call_raw("getnetworkinfo")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/peers")
 def get_peers(handler, match):
-    result, err = rpc_call("getpeerinfo")
+    result, err = rpc_call_raw("getpeerinfo")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/mining")
 def get_mining(handler, match):
-    result, err = rpc_call("getmininginfo")
+    result, err = rpc_call_raw("getmininginfo")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/wallet/balance")
 def get_balance(handler, match):
-    result, err = rpc_call("getbalances")
+    result, err = rpc_call_raw("getbalances")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/wallet/seed")
@@ -993,9 +1418,7 @@ def get_wallet_seed(handler, match):
         desc = d.get("desc", "")
         descriptors.append(desc)
         if not master_tprv:
-            m = re.match(r"^(?:sh\()?wpkh\((tprv[A-Za-z0-9]+)/", desc)
-            if m:
-                master_tprv = m.group(1)
+            master_tprv = _extract_xprv(desc, ("wpkh(tprv", "sh(wpkh(tprv"))
     info, err2 = rpc_call("getwalletinfo")
     resp = {
         "master_key": master_tprv or "",
@@ -1028,18 +1451,18 @@ def get_new_address(handler, match):
 
 @route("GET", r"/api/wallet/transactions")
 def get_wallet_transactions(handler, match):
-    result, err = rpc_call("listtransactions", ["*", 20])
+    result, err = rpc_call_raw("listtransactions", ["*", 20])
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("GET", r"/api/wallet/info")
 def get_wallet_info(handler, match):
-    result, err = rpc_call("getwalletinfo")
+    result, err = rpc_call_raw("getwalletinfo")
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_response_raw(handler, result)
 
 
 @route("POST", r"/api/wallet/generate")
@@ -1198,8 +1621,9 @@ def xprv_wallets(handler, match):
         # Now at account level — derive receive (0/i) and change (1/i) addresses
         for chain_idx in (0, 1):
             chain_key, chain_chain = _bip32_derive_child(key, chain, chain_idx)
+            chain_pub = _privkey_to_compressed_pubkey(chain_key)
             for i in range(count):
-                child_key, _ = _bip32_derive_child(chain_key, chain_chain, i)
+                child_key, _ = _bip32_derive_child(chain_key, chain_chain, i, chain_pub)
                 pubkey = _privkey_to_compressed_pubkey(child_key)
                 addr = _pubkey_to_bech32_address(pubkey)
                 path_str = f"m/84h/{coin_type}h/0h/{chain_idx}/{i}"
@@ -1274,72 +1698,170 @@ def address_balance(handler, match):
 
 # --- Rich List (UTXO scan with cache) ---
 
-_richlist_cache = {"height": -1, "data": None}
+RICHLIST_WORKERS = 4    # concurrent batches (croncoind serves 4 RPC threads by default)
+RICHLIST_BATCH = 100    # heights per getblockhash/getblock batch
+
+AMOUNT_SCALE = 10 ** 8  # amounts are tracked as ints in 1e-8 units (exact, no float drift)
+
+
+def _amount_to_units(value):
+    """Convert an RPC amount (JSON float, or Decimal / numeric string) to integer AMOUNT_SCALE units."""
+    if isinstance(value, float):
+        return int(value * AMOUNT_SCALE + 0.5)  # amounts are never negative
+    return int(decimal.Decimal(value) * AMOUNT_SCALE)
+
+
+def _empty_utxo_set():
+    """UTXO set in struct-of-arrays form: outpoint → slot, slot → address / amount."""
+    return {
+        "index": {},     # outpoint key (txid bytes + vout as 4 bytes) -> slot
+        "addrs": [],     # slot -> address (None when free)
+        "amounts": [],   # slot -> amount in AMOUNT_SCALE units
+        "free": [],      # slots released by spends, reused by new outputs
+        "balances": collections.defaultdict(int),  # address -> balance (> 0) in AMOUNT_SCALE units
+        "supply": 0,     # running sum of all balances
+    }
+
+
+# UTXO set and balances persist across calls so only new blocks are scanned
+_richlist_cache = {"height": -1, "hash": None, "utxos": _empty_utxo_set(), "data": None}
+_richlist_lock = threading.Lock()
+
+
+def _fetch_blocks(heights):
+    """Fetch verbose blocks for a run of heights with two batched RPCs (stops at the first failure)."""
+    hashes = []
+    for bhash, err in rpc_batch([("getblockhash", [h]) for h in heights]):
+        if err:
+            break
+        hashes.append(bhash)
+    blocks = []
+    for block, err in rpc_batch([("getblock", [bhash, 2]) for bhash in hashes]):
+        if err:
+            break
+        blocks.append(block)
+    return blocks
+
+
+def _iter_fetched_chunks(executor, chunks):
+    """Yield (chunk, _fetch_blocks(chunk)) in order, with at most RICHLIST_WORKERS
+    chunks fetched ahead of the consumer (bounds the verbose blocks held in memory)."""
+    chunks = iter(chunks)
+    pending = collections.deque(
+        (chunk, executor.submit(_fetch_blocks, chunk)) for chunk in itertools.islice(chunks, RICHLIST_WORKERS))
+    try:
+        while pending:
+            chunk, future = pending.popleft()
+            blocks = future.result()
+            chunk_next = next(chunks, None)
+            if chunk_next is not None:
+                pending.append((chunk_next, executor.submit(_fetch_blocks, chunk_next)))
+            yield chunk, blocks
+    finally:  # consumer stopped early: don't fetch what it won't read
+        for _, future in pending:
+            future.cancel()
+
+
+def _apply_block(block, utxos):
+    """Apply one block's spends and new outputs to the UTXO set and address balances."""
+    index, addrs, amounts, free, balances = (
+        utxos["index"], utxos["addrs"], utxos["amounts"], utxos["free"], utxos["balances"])
+    # Bound methods hoisted out of the per-input/output loops
+    index_pop, free_pop, free_append, fromhex = index.pop, free.pop, free.append, bytes.fromhex
+    addrs_append, amounts_append = addrs.append, amounts.append
+    delta = 0
+    for tx in block.get("tx", ()):
+        # Remove spent UTXOs (a coinbase tx has a single coinbase input and spends nothing)
+        vins = tx.get("vin", ())
+        if vins and "coinbase" not in vins[0]:
+            for vin in vins:
+                slot = index_pop(fromhex(vin["txid"]) + vin["vout"].to_bytes(4, "big"), -1)
+                if slot >= 0:
+                    addr, val = addrs[slot], amounts[slot]
+                    delta -= val
+                    if balances[addr] == val:
+                        del balances[addr]  # emptied: keep only holders
+                    else:
+                        balances[addr] -= val
+                    addrs[slot] = None
+                    free_append(slot)
+
+        # Add new UTXOs
+        txid = fromhex(tx["txid"])
+        for vout in tx.get("vout", ()):
+            spk = vout.get("scriptPubKey", {})
+            addr = spk.get("address")
+            if not addr:
+                continue
+            val = _amount_to_units(vout["value"])
+            if free:
+                slot = free_pop()
+                addrs[slot] = addr
+                amounts[slot] = val
+            else:
+                slot = len(addrs)
+                addrs_append(addr)
+                amounts_append(val)
+            index[txid + vout["n"].to_bytes(4, "big")] = slot
+            if val:
+                balances[addr] += val
+                delta += val
+    utxos["supply"] += delta
 
 
 def _build_richlist():
-    """Scan all blocks to build address balances from UTXOs."""
+    """Build address balances from UTXOs, scanning only blocks added since the last call."""
     info, err = rpc_call("getblockchaininfo")
     if err:
         return None, err
 
     height = info["blocks"]
 
-    # Return cache if height unchanged
-    if _richlist_cache["height"] == height and _richlist_cache["data"] is not None:
-        return _richlist_cache["data"], None
-
-    utxos = {}   # (txid, n) -> (address, value)
-    balances = {}  # address -> balance
-
-    for h in range(height + 1):
-        bhash, err = rpc_call("getblockhash", [h])
-        if err:
-            continue
-        block, err = rpc_call("getblock", [bhash, 2])
-        if err:
-            continue
-        for tx in block.get("tx", []):
-            # Remove spent UTXOs
-            for vin in tx.get("vin", []):
-                if "coinbase" in vin:
-                    continue
-                key = (vin["txid"], vin["vout"])
-                spent = utxos.pop(key, None)
-                if spent:
-                    addr, val = spent
-                    balances[addr] = balances.get(addr, 0) - val
-
-            # Add new UTXOs
-            for vout in tx.get("vout", []):
-                spk = vout.get("scriptPubKey", {})
-                addr = spk.get("address")
-                if not addr:
-                    continue
-                val = vout["value"]
-                key = (tx["txid"], vout["n"])
-                utxos[key] = (addr, val)
-                balances[addr] = balances.get(addr, 0) + val
-
-    # Build sorted list
-    rich = [
-        {"address": addr, "balance": bal}
-        for addr, bal in balances.items()
-        if bal > 0
-    ]
-    rich.sort(key=lambda x: x["balance"], reverse=True)
-
-    total_supply = sum(item["balance"] for item in rich)
-    result = {
-        "height": height,
-        "total_supply": total_supply,
-        "total_addresses": len(rich),
-        "addresses": rich[:100],
-    }
+    with _richlist_lock:
+        cache = _richlist_cache
+
+        # Return cache if the tip is unchanged
+        tip = cache["hash"]
+        same_tip = tip == info.get("bestblockhash", tip)
+        if cache["height"] == height and cache["data"] is not None and same_tip:
+            return cache["data"], None
+
+        # Reorg / reindex: chain got shorter or our last block is no longer on it → start over from genesis
+        if cache["height"] >= 0:
+            if height <= cache["height"]:
+                stale = height < cache["height"] or not same_tip
+            else:
+                bhash, err = rpc_call("getblockhash", [cache["height"]])
+                stale = not err and bhash != tip
+            if stale:
+                cache.update(height=-1, hash=None, utxos=_empty_utxo_set(), data=None)
+
+        utxos = cache["utxos"]
+
+        # Fetch batches concurrently (RPC is I/O-bound); apply in height order on this thread
+        start = cache["height"] + 1
+        chunks = [range(h, min(h + RICHLIST_BATCH, height + 1)) for h in range(start, height + 1, RICHLIST_BATCH)]
+        with ThreadPoolExecutor(RICHLIST_WORKERS) as executor:
+            for chunk, blocks in _iter_fetched_chunks(executor, chunks):
+                for block in blocks:
+                    _apply_block(block, utxos)
+                if blocks:
+                    cache["height"], cache["hash"] = blocks[-1]["height"], blocks[-1]["hash"]
+                if len(blocks) < len(chunk):
+                    break  # RPC failure: resume from here on the next call
+
+        # Top 100 by balance: O(N) partial selection instead of sorting every holder
+        balances = utxos["balances"]
+        top = heapq.nlargest(100, balances.items(), key=operator.itemgetter(1))
+        result = {
+            "height": cache["height"],
+            "total_supply": utxos["supply"] / AMOUNT_SCALE,
+            "total_addresses": len(balances),
+            "addresses": [{"address": addr, "balance": bal / AMOUNT_SCALE} for addr, bal in top],
+        }
 
-    _richlist_cache["height"] = height
-    _richlist_cache["data"] = result
-    return result, None
+        cache["data"] = result
+        return result, None
 
 
 @route("GET", r"/api/richlist")
@@ -1353,6 +1875,14 @@ def get_richlist(handler, match):
 # --- Address Transaction History (block scan with cache) ---
 
 _addr_tx_cache = {"height": -1, "data": {}}
+_addr_tx_lock = threading.Lock()
+
+
+def _addr_tx_cached(address, height):
+    """Cached history of address at height, or None (safe to call without _addr_tx_lock)."""
+    if _addr_tx_cache["height"] != height:
+        return None
+    return _addr_tx_cache["data"].get(address)
 
 
 def _build_address_transactions(address):
@@ -1363,72 +1893,84 @@ def _build_address_transactions(address):
 
     height = info["blocks"]
 
-    # Return cache if height unchanged and address is cached
-    if _addr_tx_cache["height"] == height and address in _addr_tx_cache["data"]:
-        return _addr_tx_cache["data"][address], None
-
-    # Reset cache if height changed
-    if _addr_tx_cache["height"] != height:
-        _addr_tx_cache["height"] = height
-        _addr_tx_cache["data"] = {}
-
-    transactions = []
-    balance = 0.0
-
-    for h in range(height + 1):
-        bhash, err = rpc_call("getblockhash", [h])
-        if err:
-            continue
-        block, err = rpc_call("getblock", [bhash, 2])
-        if err:
-            continue
-
-        for tx in block.get("tx", []):
-            sent = 0.0
-            received = 0.0
-
-            # Check inputs (sent from this address)
-            for vin in tx.get("vin", []):
-                if "coinbase" in vin:
-                    continue
-                # Look up the spent output to check if it belongs to our address
-                prev_txid = vin.get("txid")
-                prev_vout = vin.get("vout")
-                if prev_txid is not None and prev_vout is not None:
-                    prev_tx, perr = rpc_call("getrawtransaction", [prev_txid, True])
-                    if not perr and prev_tx:
-                        for pv in prev_tx.get("vout", []):
-                            if pv["n"] == prev_vout:
-                                spk = pv.get("scriptPubKey", {})
-                                if spk.get("address") == address:
-                                    sent += pv["value"]
-                                break
-
-            # Check outputs (received by this address)
-            for vout in tx.get("vout", []):
-                spk = vout.get("scriptPubKey", {})
-                if spk.get("address") == address:
-                    received += vout["value"]
-
-            if sent > 0 or received > 0:
-                balance += received - sent
-                transactions.append({
-                    "txid": tx["txid"],
-                    "blockheight": block["height"],
-                    "time": block["time"],
-                    "sent": round(sent, 8),
-                    "received": round(received, 8),
-                    "balance": round(balance, 8),
-                })
-
-    result = {
-        "address": address,
-        "tx_count": len(transactions),
-        "transactions": transactions,
-    }
+    # Cache hits don't wait behind another address's scan
+    cached = _addr_tx_cached(address, height)
+    if cached is not None:
+        return cached, None
+
+    # One scan at a time: concurrent requests would otherwise each walk the chain
+    with _addr_tx_lock:
+        # Another request may have scanned this address while we waited
+        cached = _addr_tx_cached(address, height)
+        if cached is not None:
+            return cached, None
+
+        # Reset cache if height changed (new dict first, so lock-free readers
+        # that see the new height never read the old height's entries)
+        if _addr_tx_cache["height"] != height:
+            _addr_tx_cache["data"] = {}
+            _addr_tx_cache["height"] = height
+
+        transactions = []
+        balance = 0.0
+
+        # Batched block fetches run concurrently; transactions are folded in height order
+        chunks = [range(h, min(h + RICHLIST_BATCH, height + 1)) for h in range(0, height + 1, RICHLIST_BATCH)]
+        complete = True
+        with ThreadPoolExecutor(RICHLIST_WORKERS) as executor:
+            for chunk, blocks in _iter_fetched_chunks(executor, chunks):
+                if len(blocks) < len(chunk):  # a batch failed part-way: retry the rest once
+                    blocks += _fetch_blocks(chunk[len(blocks):])
+                    if len(blocks) < len(chunk):
+                        complete = False  # heights missing: return what we have, don't cache it
+                for block in blocks:
+                    for tx in block.get("tx", []):
+                        sent = 0.0
+                        received = 0.0
+
+                        # Check inputs (sent from this address)
+                        for vin in tx.get("vin", []):
+                            if "coinbase" in vin:
+                                continue
+                            # Look up the spent output to check if it belongs to our address
+                            prev_txid = vin.get("txid")
+                            prev_vout = vin.get("vout")
+                            if prev_txid is not None and prev_vout is not None:
+                                prev_tx, perr = rpc_call("getrawtransaction", [prev_txid, True])
+                                if not perr and prev_tx:
+                                    for pv in prev_tx.get("vout", []):
+                                        if pv["n"] == prev_vout:
+                                            spk = pv.get("scriptPubKey", {})
+                                            if spk.get("address") == address:
+                                                sent += pv["value"]
+                                            break
+
+                        # Check outputs (received by this address)
+                        for vout in tx.get("vout", []):
+                            spk = vout.get("scriptPubKey", {})
+                            if spk.get("address") == address:
+                                received += vout["value"]
+
+                        if sent > 0 or received > 0:
+                            balance += received - sent
+                            transactions.append({
+                                "txid": tx["txid"],
+                                "blockheight": block["height"],
+                                "time": block["time"],
+                                "sent": round(sent, 8),
+                                "received": round(received, 8),
+                                "balance": round(balance, 8),
+                            })
+
+        result = {
+            "address": address,
+            "tx_count": len(transactions),
+            "transactions": transactions,
+        }
 
-    _addr_tx_cache["data"][address] = result
-    return result, None
+        if complete:
+            _addr_tx_cache["data"][address] = result
+        return result, None
 
 
 @route("GET", r"/api/address/([a-zA-Z0-9]+)/transactions")
@@ -1437,7 +1979,7 @@ def get_address_transactions(handler, match):
     result, err = _build_address_transactions(address)
     if err:
         return error_response(handler, err["message"])
-    json_response(handler, result)
+    json_stream_response(handler, result, "transactions")
 
 
 # --- POST endpoints ---
@@ -1810,11 +2352,23 @@ def _read_body(handler):
     if length == 0:
         return {}
     try:
-        return json.loads(handler.rfile.read(length).decode())
-    except (json.JSONDecodeError, UnicodeDecodeError):
+        return _loads(handler.rfile.read(length))
+    except (_JSONDecodeError, UnicodeDecodeError):
         return None
 
 
+STATIC_CACHE_MAX_BYTES = 256 * 1024  # larger files are streamed with sendfile
+STATIC_CACHE_CONTROL = "public, max-age=300"
+STATIC_CACHE_CONTROL_HTML = "no-cache"  # always revalidate (cheap 304): it names the ?v= versioned assets
+
+
+@functools.lru_cache(maxsize=64)
+def _read_static(full_path, mtime_ns, size):
+    """Read a small static file; mtime/size are part of the cache key so edits are picked up."""
+    with open(full_path, "rb") as f:
+        return f.read()
+
+
 class DashboardHandler(http.server.BaseHTTPRequestHandler):
     def do_GET(self):
         self._route("GET")
@@ -1832,16 +2386,18 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
 
     def _route(self, method):
         path = self.path.split("?")[0]
-        for route_method, pattern, handler_func in ROUTES:
-            if route_method != method:
-                continue
-            m = pattern.match(path)
-            if m:
-                try:
-                    handler_func(self, m)
-                except Exception as e:
-                    error_response(self, str(e))
-                return
+        handler_func = STATIC_ROUTES.get((method, path))
+        m = None
+        if handler_func is None:
+            hit = _resolve(method, path)
+            if hit:
+                handler_func, m = hit
+        if handler_func is not None:
+            try:
+                handler_func(self, m)
+            except Exception as e:
+                error_response(self, str(e))
+            return
         # Fallback: serve static files (for standalone mode without nginx)
         if method == "GET" and not path.startswith("/api/"):
             self._serve_static(path)
@@ -1860,23 +2416,65 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
         if not os.path.isfile(full_path):
             error_response(self, "Not found", 404)
             return
-        ext = os.path.splitext(full_path)[1]
-        content_type = MIME_TYPES.get(ext, "application/octet-stream")
+        dot = full_path.rfind(".")
+        content_type = MIME_TYPES.get(full_path[dot:] if dot >= 0 else "", "application/octet-stream")
         try:
+            st = os.stat(full_path)
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            cache_control = STATIC_CACHE_CONTROL_HTML if content_type == "text/html" else STATIC_CACHE_CONTROL
+            if self._etag_matches(etag):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.end_headers()
+                return
+            if st.st_size < STATIC_CACHE_MAX_BYTES:
+                data = _read_static(full_path, st.st_mtime_ns, st.st_size)
+                self._send_static_headers(content_type, len(data), etag, cache_control)
+                self.wfile.write(data)
+                return
             with open(full_path, "rb") as f:
-                data = f.read()
-            self.send_response(200)
-            self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+                size = os.fstat(f.fileno()).st_size
+                self._send_static_headers(content_type, size, etag, cache_control)
+                # Kernel-side copy via os.sendfile (socket.sendfile falls back to send() if unavailable)
+                self.connection.sendfile(f, 0, size)
         except IOError:
             error_response(self, "Read error", 500)
 
+    def _etag_matches(self, etag):
+        """True if the client's If-None-Match already names this ETag (→ 304)."""
+        inm = self.headers.get("If-None-Match")
+        if not inm:
+            return False
+        return any(t.strip().removeprefix("W/") in (etag, "*") for t in inm.split(","))
+
+    def _send_static_headers(self, content_type, length, etag, cache_control):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+
     def log_message(self, format, *args):
         sys.stderr.write(f"[API] {self.address_string()} - {format % args}\n")
 
 
+class ReusePortHTTPServer(http.server.ThreadingHTTPServer):
+    """Threading server whose listening socket can be bound by several processes at once."""
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def _fork_workers(count):
+    """Fork count-1 children; returns in every process (the kernel spreads accepts across their sockets)."""
+    for _ in range(count - 1):
+        if os.fork() == 0:
+            _rpc_pool.clear()  # keep-alive sockets inherited from the parent must not be shared
+            return
+
+
 def main():
     init_db()
     print(f"CronCoin Dashboard API starting on port {LISTEN_PORT}")
@@ -1890,7 +2488,14 @@ def main():
     else:
         print(f"Connected to {result.get('chain', '?')} chain at height {result.get('blocks', '?')}")
 
-    server = http.server.HTTPServer(("0.0.0.0", LISTEN_PORT), DashboardHandler)
+    # One thread per connection so a slow endpoint (e.g. richlist) doesn't stall the rest;
+    # optionally several processes so CPU-bound endpoints (EC math) use more than one core
+    if WORKERS > 1 and hasattr(socket, "SO_REUSEPORT"):
+        print(f"Starting {WORKERS} worker processes")
+        _fork_workers(WORKERS)
+        server = ReusePortHTTPServer(("0.0.0.0", LISTEN_PORT), DashboardHandler)
+    else:
+        server = http.server.ThreadingHTTPServer(("0.0.0.0", LISTEN_PORT), DashboardHandler)
     try:
         server.serve_forever()
     except KeyboardInterrupt: